@@ -1,7 +1,11 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, get_type_hints
+from dataclasses import replace
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, get_type_hints
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 from pydantic_core import PydanticUndefined
+import copy
+import heapq
 import inspect
+import weakref
 
 from pydantic_ai import Agent, RunContext
 from pydantic_ai.models.test import TestModel
@@ -15,6 +19,51 @@ from ..validation.ai_validator import AiValidator
 
 T = TypeVar('T', bound=BaseModel)
 
+# Sort rank for each priority, CRITICAL first (follows enum declaration order)
+_PRIORITY_RANK = {priority: rank for rank, priority in enumerate(FieldPriority)}
+
+# Field configs and default order per model class, so repeated forms over the
+# same model skip field extraction and dependency resolution
+_FIELD_PLAN_CACHE: "weakref.WeakKeyDictionary[type, Tuple[Dict[str, FieldConfig], Tuple[str, ...]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Per-field options accepted by configure() and configure_field()
+_FIELD_UPDATE_OPTIONS = frozenset({"priority", "custom_question", "validation_hint", "examples", "cluster"})
+
+# AIForm attributes shared between a form and its deepcopy snapshots
+_SHARED_ON_COPY = frozenset({"model_class", "agent", "ai_validator"})
+
+
+def _field_config_from_pydantic(field_name: str, field_info: Any, field_type: type) -> FieldConfig:
+    """Build a FieldConfig from a Pydantic field and its json_schema_extra metadata"""
+    extra = field_info.json_schema_extra or {}
+    
+    return FieldConfig(
+        name=field_name,
+        field_type=field_type,
+        description=field_info.description or "",
+        priority=extra.get("priority", FieldPriority.MEDIUM),
+        cluster=extra.get("cluster"),
+        custom_question=extra.get("custom_question"),
+        examples=tuple(extra.get("examples", ())),
+        validation_hint=extra.get("validation_hint"),
+        dependencies=extra.get("dependencies", []),
+        skip_if=extra.get("skip_if"),
+        required=field_info.is_required(),
+        default=field_info.default if field_info.default is not PydanticUndefined else None
+    )
+
+
+def _copy_field_config(config: FieldConfig) -> FieldConfig:
+    """Copy a FieldConfig, including its list fields, so copies can be mutated independently
+
+    Model-declared examples are stored as a tuple and shared rather than copied.
+    """
+    examples = config.examples if isinstance(config.examples, tuple) else list(config.examples)
+    return replace(config, examples=examples, dependencies=list(config.dependencies))
+
 
 class AIForm(Generic[T]):
     """AI-powered conversational form for collecting structured data"""
@@ -74,12 +123,12 @@ class AIForm(Generic[T]):
         self._collected_data: Dict[str, Any] = {}
         self._conversation_history = []  # Will store pydantic-ai conversation history
         self._form_complete = False
+        self._final_response: Optional[FormResponse[T]] = None
         self._started = False
-        self._field_order: List[str] = []
         self._context: Dict[str, Any] = {}
         
-        self._initialize_fields()
-        self._calculate_field_order()
+        self._load_field_plan()
+        self._order_dirty = False
     
     def _build_system_prompt(self) -> str:
         """Build conversational system prompt from model definition"""
@@ -242,41 +291,80 @@ Start by greeting the user, then immediately check what fields are needed and as
         collected_count = len(self._collected_data)
         return (collected_count / total_fields) * 100.0
     
+    def _load_field_plan(self):
+        """Load field configs and order, computing them once per model class"""
+        plan = _FIELD_PLAN_CACHE.get(self.model_class)
+        if plan is None:
+            self._initialize_fields()
+            self._ordered_fields = self._calculate_field_order()
+            _FIELD_PLAN_CACHE[self.model_class] = (
+                {name: _copy_field_config(config) for name, config in self._field_configs.items()},
+                self._ordered_fields
+            )
+            return
+        
+        # Configs are mutated by configure_field, so each form gets its own copies;
+        # the order is an immutable tuple and is shared as-is
+        template_configs, self._ordered_fields = plan
+        self._field_configs = {name: _copy_field_config(config) for name, config in template_configs.items()}
+    
     def _initialize_fields(self):
         """Extract field configurations from Pydantic model"""
-        model_fields = self.model_class.model_fields
         type_hints = get_type_hints(self.model_class)
-        
-        for field_name, field_info in model_fields.items():
-            field_type = type_hints.get(field_name, str)
-            description = field_info.description or ""
-            
-            # Extract metadata from json_schema_extra
-            extra = field_info.json_schema_extra or {}
-            
-            config = FieldConfig(
-                name=field_name,
-                field_type=field_type,
-                description=description,
-                priority=extra.get("priority", FieldPriority.MEDIUM),
-                cluster=extra.get("cluster"),
-                custom_question=extra.get("custom_question"),
-                examples=extra.get("examples", []),
-                validation_hint=extra.get("validation_hint"),
-                dependencies=extra.get("dependencies", []),
-                skip_if=extra.get("skip_if"),
-                required=field_info.is_required(),
-                default=field_info.default if field_info.default is not PydanticUndefined else None
-            )
-            
-            self._field_configs[field_name] = config
+        self._field_configs = {
+            field_name: _field_config_from_pydantic(field_name, field_info, type_hints.get(field_name, str))
+            for field_name, field_info in self.model_class.model_fields.items()
+        }
+    
+    @property
+    def _field_order(self) -> Tuple[str, ...]:
+        """Field order, recalculated lazily after configuration changes"""
+        if self._order_dirty:
+            self._ordered_fields = self._calculate_field_order()
+            self._order_dirty = False
+        return self._ordered_fields
     
-    def _calculate_field_order(self):
-        """Calculate field order based on priority and dependencies"""
-        # Simple implementation - just use the order from field configs
-        # In the future this could implement proper dependency resolution
-        self._field_order = list(self._field_configs.keys())
+    def _calculate_field_order(self) -> Tuple[str, ...]:
+        """Calculate field order based on priority and dependencies
         
+        Kahn's topological sort, always taking the highest-priority ready field
+        (model order breaks ties). Fields left over when no field is ready form a
+        dependency cycle, so cycle detection happens in the same pass.
+        """
+        configs = self._field_configs
+        position = {name: index for index, name in enumerate(configs)}
+        
+        # Unknown dependencies are ignored; they cannot block a field
+        pending = {
+            name: {dep for dep in config.dependencies if dep in configs}
+            for name, config in configs.items()
+        }
+        dependents: Dict[str, List[str]] = {name: [] for name in configs}
+        for name, deps in pending.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        
+        in_degree = {name: len(deps) for name, deps in pending.items()}
+        ready = [
+            (_PRIORITY_RANK[configs[name].priority], position[name], name)
+            for name, degree in in_degree.items() if degree == 0
+        ]
+        heapq.heapify(ready)
+        
+        order: List[str] = []
+        while ready:
+            _, _, name = heapq.heappop(ready)
+            order.append(name)
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, (_PRIORITY_RANK[configs[dependent].priority], position[dependent], dependent))
+        
+        if len(order) < len(configs):
+            cyclic = [name for name in configs if in_degree[name] > 0]
+            raise ConfigurationError(f"Circular dependency involving fields: {', '.join(cyclic)}")
+        
+        return tuple(order)
     
     def configure_field(
         self,
@@ -288,15 +376,50 @@ Start by greeting the user, then immediately check what fields are needed and as
         cluster: Optional[str] = None
     ) -> 'AIForm[T]':
         """Configure a specific field (fluent interface)"""
-        if field_name not in self._field_configs:
-            raise ConfigurationError(f"Field '{field_name}' not found in model")
+        return self.configure({
+            field_name: {
+                "priority": priority,
+                "custom_question": custom_question,
+                "validation_hint": validation_hint,
+                "examples": examples,
+                "cluster": cluster
+            }
+        })
+    
+    def configure(self, updates: Dict[str, Dict[str, Any]]) -> 'AIForm[T]':
+        """Configure several fields at once, e.g. {"age": {"priority": FieldPriority.HIGH}}"""
+        unknown = [field_name for field_name in updates if field_name not in self._field_configs]
+        if unknown:
+            raise ConfigurationError(f"Field '{unknown[0]}' not found in model")
         
-        # Validate priority is a valid FieldPriority enum value
-        if priority is not None:
-            from ..types.enums import FieldPriority
-            if not isinstance(priority, FieldPriority):
+        # Validate the whole batch first so a bad entry leaves every field untouched
+        for field_name, field_updates in updates.items():
+            unexpected = sorted(set(field_updates) - _FIELD_UPDATE_OPTIONS)
+            if unexpected:
+                raise ConfigurationError(
+                    f"Unknown configuration option(s) for field '{field_name}': {', '.join(unexpected)}"
+                )
+            priority = field_updates.get("priority")
+            if priority is not None and not isinstance(priority, FieldPriority):
                 raise ValueError(f"Priority must be a FieldPriority enum value, got: {priority}")
         
+        for field_name, field_updates in updates.items():
+            self._apply_field_update(field_name, **field_updates)
+        
+        # Defer reordering until the order is next read, so a batch sorts once
+        self._order_dirty = True
+        return self
+    
+    def _apply_field_update(
+        self,
+        field_name: str,
+        priority: Optional[FieldPriority] = None,
+        custom_question: Optional[str] = None,
+        validation_hint: Optional[str] = None,
+        examples: Optional[List[str]] = None,
+        cluster: Optional[str] = None
+    ) -> None:
+        """Apply already-validated configuration overrides to a single field config in place"""
         config = self._field_configs[field_name]
         if priority is not None:
             config.priority = priority
@@ -308,9 +431,45 @@ Start by greeting the user, then immediately check what fields are needed and as
             config.examples = examples
         if cluster is not None:
             config.cluster = cluster
-            
-        self._calculate_field_order()
-        return self
+    
+    def reset(self) -> None:
+        """Clear collected data and conversation state so the form can be reused"""
+        self._collected_data = {}
+        self._conversation_history = []
+        self._form_complete = False
+        self._final_response = None
+        self._started = False
+    
+    def __copy__(self) -> 'AIForm[T]':
+        """Copy a form's configuration into a fresh, unstarted form
+        
+        The agent, validator and field order are shared with the original; field
+        configs get their own copies so configure_field on one form never leaks
+        into the other. Collected data and conversation state start empty.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone._field_configs = {name: _copy_field_config(config) for name, config in self._field_configs.items()}
+        clone._ordered_fields = self._field_order
+        clone._order_dirty = False
+        clone._context = dict(self._context)
+        clone.reset()
+        return clone
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'AIForm[T]':
+        """Snapshot a form, including collected data and conversation history
+        
+        The model class and the collaborators that hold agents or clients (the
+        agent and AI validator) are shared rather than copied.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        memo[id(self)] = clone
+        for name, value in self.__dict__.items():
+            if name in _SHARED_ON_COPY:
+                setattr(clone, name, value)
+            else:
+                setattr(clone, name, copy.deepcopy(value, memo))
+        return clone
     
     def set_context(self, context: Dict[str, Any]) -> None:
         """Set context for question generation"""
@@ -319,6 +478,19 @@ Start by greeting the user, then immediately check what fields are needed and as
     async def start(self) -> FormResponse[T]:
         """Start the conversational form"""
         self._started = True
+        # Restarting a completed form begins a new conversation rather than replaying the result
+        self._form_complete = False
+        self._final_response = None
+        
+        # Nothing to collect: complete immediately without a conversation turn
+        if not self._field_configs:
+            self._form_complete = True
+            self._final_response = FormResponse(
+                is_complete=True,
+                data=self.model_class(),
+                progress=100.0
+            )
+            return self._final_response
         
         if not self.use_ai or not self.agent:
             # Fallback to simple mode
@@ -339,6 +511,10 @@ Start by greeting the user, then immediately check what fields are needed and as
     
     async def respond(self, user_input: str) -> FormResponse[T]:
         """Process user response through conversational AI with tool usage"""
+        # A completed form ignores further input and repeats its final response
+        if self._final_response is not None:
+            return self._final_response
+        
         if not self.use_ai or not self.agent:
             # Fallback to simple mode
             return FormResponse(
@@ -359,12 +535,13 @@ Start by greeting the user, then immediately check what fields are needed and as
         if self._form_complete:
             try:
                 model_instance = self.model_class(**self._collected_data)
-                return FormResponse(
+                self._final_response = FormResponse(
                     is_complete=True,
                     data=model_instance,
                     progress=100.0,
                     collected_fields=list(self._collected_data.keys())
                 )
+                return self._final_response
             except Exception as e:
                 return FormResponse(
                     question=f"Let me verify your information. {ai_response}",
@@ -380,6 +557,17 @@ Start by greeting the user, then immediately check what fields are needed and as
             collected_fields=list(self._collected_data.keys())
         )
     
+    async def respond_many(self, inputs: Sequence[str]) -> FormResponse[T]:
+        """Process several user responses in order, stopping once the form completes"""
+        if not inputs:
+            raise ValueError("respond_many requires at least one input")
+        
+        for user_input in inputs:
+            response = await self.respond(user_input)
+            if response.is_complete:
+                break
+        return response
+    
     async def _create_model_instance(self) -> T:
         """Create and validate Pydantic model instance using AI validator"""
         try:
@@ -6,6 +6,19 @@ from pydantic_ai import Agent
 from pydantic_ai.models.test import TestModel
 
 
+# Deterministic questions served by PydanticAIQuestionGenerator in test mode
+_TEST_RESPONSES = (
+    "What is your name?",
+    "Could you provide your email address?", 
+    "How old are you?",
+    "What is your phone number?",
+    "Please tell us about your skills",
+    "What's your experience level?",
+    "Are you interested in our newsletter?",
+    "Please provide this information"
+)
+
+
 class QuestionGenerator(ABC):
     """Base class for generating questions from field configurations"""
     
@@ -48,17 +61,8 @@ class PydanticAIQuestionGenerator(QuestionGenerator):
         
         self.test_mode = test_mode
         if test_mode:
-            # Use TestModel for deterministic testing with predefined responses
-            self.test_responses = [
-                "What is your name?",
-                "Could you provide your email address?", 
-                "How old are you?",
-                "What is your phone number?",
-                "Please tell us about your skills",
-                "What's your experience level?",
-                "Are you interested in our newsletter?",
-                "Please provide this information"
-            ]
+            # Use predefined responses for deterministic testing
+            self.test_responses = _TEST_RESPONSES
             self.response_index = 0
             # Don't create agent in test mode, handle manually
             self.agent = None
@@ -68,6 +72,10 @@ class PydanticAIQuestionGenerator(QuestionGenerator):
                 system_prompt=self._get_system_prompt()
             )
     
+    def reset(self) -> None:
+        """Rewind the test-mode response sequence so the generator can be reused"""
+        self.response_index = 0
+    
     def _get_system_prompt(self) -> str:
         return """You are a helpful form assistant that generates conversational questions for data collection.
 
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import Any, Dict, Type, List, get_origin, get_args
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 
@@ -8,6 +9,45 @@ from ..types.config import FieldConfig
 from ..types.exceptions import ValidationError
 
 
+# Recognised boolean spellings, matched against lowercased input
+_BOOL_MAP = {
+    "yes": True, "true": True, "1": True, "y": True, "on": True, "enabled": True,
+    "no": False, "false": False, "0": False, "n": False, "off": False, "disabled": False,
+}
+
+# Returned by simple parsing when the input needs the AI parser
+_NOT_PARSED = object()
+
+# Deterministic parse results served by AIResponseParser in test mode,
+# keyed by field name first and then by type name; read-only since every
+# parser instance shares it
+_TEST_RESPONSES = MappingProxyType({
+    # Age fields
+    'age': '28',
+    # Name fields
+    'name': 'Alice Johnson',
+    'full_name': 'Alice Johnson', 
+    'applicant_name': 'Alice Johnson',
+    # Email fields
+    'email': 'alice@example.com',
+    # Phone fields  
+    'phone': '123-456-7890',
+    # Boolean fields
+    'newsletter': 'yes',
+    'active': 'true',
+    'subscribe': 'yes',
+    # List fields
+    'skills': 'python,javascript,sql',
+    'tags': 'web,backend,api',
+    # Default responses by type
+    'str': 'test value',
+    'int': '25',
+    'float': '3.14',
+    'bool': 'true',
+    'list': 'item1,item2,item3'
+})
+
+
 class AIResponseParser:
     """AI-powered response parser for complex field types"""
     
@@ -16,31 +56,7 @@ class AIResponseParser:
         self.test_mode = test_mode
         if test_mode:
             # Use deterministic responses for testing based on field type and name
-            self.test_responses = {
-                # Age fields
-                'age': '28',
-                # Name fields
-                'name': 'Alice Johnson',
-                'full_name': 'Alice Johnson', 
-                'applicant_name': 'Alice Johnson',
-                # Email fields
-                'email': 'alice@example.com',
-                # Phone fields  
-                'phone': '123-456-7890',
-                # Boolean fields
-                'newsletter': 'yes',
-                'active': 'true',
-                'subscribe': 'yes',
-                # List fields
-                'skills': 'python,javascript,sql',
-                'tags': 'web,backend,api',
-                # Default responses by type
-                'str': 'test value',
-                'int': '25',
-                'float': '3.14',
-                'bool': 'true',
-                'list': 'item1,item2,item3'
-            }
+            self.test_responses = _TEST_RESPONSES
             # Don't create agent in test mode
             self.agent = None
         else:
@@ -74,16 +90,17 @@ Be flexible with input formats but strict with output format."""
     ) -> Any:
         """Parse user response using AI for the given field configuration"""
         
-        # First try simple parsing for basic types
+        # First try simple parsing for basic types; the AI parser is only
+        # consulted when simple parsing cannot handle the input
         simple_result = self._try_simple_parsing(user_input, field_config)
-        if simple_result is not None:
+        if simple_result is not _NOT_PARSED:
             return simple_result
         
         # Use AI for complex parsing
         return await self._ai_parse(user_input, field_config, context or {})
     
     def _try_simple_parsing(self, user_input: str, field_config: FieldConfig) -> Any:
-        """Try simple parsing first for basic types"""
+        """Try simple parsing first for basic types, returning _NOT_PARSED on failure"""
         value = user_input.strip()
         field_type = field_config.field_type
         
@@ -107,7 +124,7 @@ Be flexible with input formats but strict with output format."""
             try:
                 return int(value)
             except ValueError:
-                # Don't return None for non-numeric strings - let AI handle them
+                # Non-numeric strings are left for the AI to handle
                 pass
         elif field_type == float:
             try:
@@ -115,13 +132,9 @@ Be flexible with input formats but strict with output format."""
             except ValueError:
                 pass
         elif field_type == bool:
-            lower_val = value.lower()
-            if lower_val in ("yes", "true", "1", "y", "on", "enabled"):
-                return True
-            elif lower_val in ("no", "false", "0", "n", "off", "disabled"):
-                return False
+            return _BOOL_MAP.get(value.lower(), _NOT_PARSED)
         
-        return None
+        return _NOT_PARSED
     
     async def _ai_parse(
         self,
@@ -174,7 +187,8 @@ If you cannot parse it, return an error message starting with "ERROR:".
                 return self._validate_parsed_result(parsed_value, field_config)
             except ValidationError:
                 # If validation fails in test mode, fall back to simple parsing
-                return self._try_simple_parsing(user_input, field_config) or user_input
+                simple_result = self._try_simple_parsing(user_input, field_config)
+                return user_input if simple_result is _NOT_PARSED else simple_result
         
         try:
             result = await self.agent.run(prompt)
@@ -251,11 +265,9 @@ If you cannot parse it, return an error message starting with "ERROR:".
         
         elif field_type == bool and not isinstance(parsed_value, bool):
             if isinstance(parsed_value, str):
-                lower_val = parsed_value.lower()
-                if lower_val in ("yes", "true", "1", "y"):
-                    return True
-                elif lower_val in ("no", "false", "0", "n"):
-                    return False
+                bool_value = _BOOL_MAP.get(parsed_value.strip().lower())
+                if bool_value is not None:
+                    return bool_value
             raise ValidationError(f"Expected boolean, got {parsed_value}")
         
         return parsed_value
\ No newline at end of file
@@ -1,9 +1,9 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from .enums import FieldPriority
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldConfig:
     name: str
     field_type: type
@@ -11,7 +11,7 @@ class FieldConfig:
     priority: FieldPriority = FieldPriority.MEDIUM
     cluster: Optional[str] = None
     custom_question: Optional[str] = None
-    examples: List[str] = field(default_factory=list)
+    examples: Sequence[str] = field(default_factory=list)
     validation_hint: Optional[str] = None
     dependencies: List[str] = field(default_factory=list)
     skip_if: Optional[Callable[[Dict[str, Any]], bool]] = None
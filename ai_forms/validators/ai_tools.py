@@ -1,4 +1,5 @@
 """AI-powered validation tools using pydantic-ai chat functions"""
+import re
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from ..types.config import FieldConfig
@@ -6,6 +7,17 @@ from ..types.exceptions import ValidationError
 
 from pydantic_ai import Agent
 
+# Plain ASCII integers, the common case, parse without the word lookup or try/except
+_INTEGER_PATTERN = re.compile(r"[+-]?[0-9]+")
+
+# Written numbers understood by integer parsing
+_WORD_NUMBERS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
+    'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
+    'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20
+}
+
 
 class ValidationResult(BaseModel):
     """Result of validation operation"""
@@ -237,16 +249,13 @@ Always return properly parsed/converted values through the validation tools.
         # Remove common formatting
         clean_value = value.replace(',', '').replace('_', '').strip()
         
-        # Handle written numbers (basic)
-        word_to_num = {
-            'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-            'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-            'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14, 'fifteen': 15,
-            'sixteen': 16, 'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20
-        }
+        if _INTEGER_PATTERN.fullmatch(clean_value):
+            return int(clean_value)
         
-        if clean_value.lower() in word_to_num:
-            return word_to_num[clean_value.lower()]
+        # Handle written numbers (basic)
+        word_value = _WORD_NUMBERS.get(clean_value.lower())
+        if word_value is not None:
+            return word_value
         
         try:
             return int(clean_value)
@@ -333,7 +342,6 @@ Always return properly parsed/converted values through the validation tools.
         if 'min_length' in hint_lower or 'max_length' in hint_lower:
             length = len(str(parsed_value)) if isinstance(parsed_value, str) else len(parsed_value) if isinstance(parsed_value, list) else 0
             
-            import re
             min_match = re.search(r'min_length[=:]\s*(\d+)', hint_lower)
             max_match = re.search(r'max_length[=:]\s*(\d+)', hint_lower)
             
@@ -344,7 +352,6 @@ Always return properly parsed/converted values through the validation tools.
         
         # Pattern validation
         if 'pattern' in hint_lower or 'regex' in hint_lower:
-            import re
             pattern_match = re.search(r'pattern[=:]\s*([^\s,]+)', validation_hint)
             if pattern_match:
                 pattern = pattern_match.group(1)
@@ -369,7 +376,6 @@ Always return properly parsed/converted values through the validation tools.
             num_value = float(value)
             
             # Extract min/max from hint
-            import re
             min_match = re.search(r'min[=:]\s*(\d+)', hint)
             max_match = re.search(r'max[=:]\s*(\d+)', hint)
             
@@ -1,9 +1,40 @@
 """Pytest configuration and shared fixtures"""
+import asyncio
+import copy
 import pytest
 from typing import List, Optional
 from pydantic import BaseModel, Field
-from ai_forms import AIForm, ConversationMode, FieldPriority, ValidationStrategy
-from .test_helpers import ensure_test_mode_environment, restore_environment
+from ai_forms import AIForm, DefaultQuestionGenerator, FieldPriority
+from .test_helpers import ensure_test_mode_environment, make_chain_model, make_wide_model, restore_environment
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-perf", action="store_true", default=False,
+        help="run tests marked perf (skipped by default)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip perf tests unless --run-perf is given, and keep them on one xdist worker
+    so session model fixtures are built once"""
+    run_perf = config.getoption("--run-perf")
+    skip_perf = pytest.mark.skip(reason="perf test; use --run-perf to run")
+    for item in items:
+        if item.get_closest_marker("perf"):
+            item.add_marker(pytest.mark.xdist_group("perf_models"))
+            if not run_perf:
+                item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the shared session loop on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -14,7 +45,7 @@ def test_environment():
     restore_environment(original_env)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_user_model():
     """Simple user model for basic testing"""
     class UserProfile(BaseModel):
@@ -25,7 +56,7 @@ def simple_user_model():
     return UserProfile
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_job_model():
     """Complex job application model with metadata"""
     class JobApplication(BaseModel):
@@ -89,7 +120,7 @@ def complex_job_model():
     return JobApplication
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_model():
     """Model with no fields for edge case testing"""
     class EmptyModel(BaseModel):
@@ -98,7 +129,7 @@ def empty_model():
     return EmptyModel
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def circular_dependency_model():
     """Model with circular dependencies for error testing"""
     class CircularModel(BaseModel):
@@ -114,38 +145,74 @@ def circular_dependency_model():
     return CircularModel
 
 
+@pytest.fixture(scope="session")
+def type_test_model():
+    """Model with one field per basic type"""
+    class TypeTestModel(BaseModel):
+        integer_field: int = Field(description="An integer field")
+        float_field: float = Field(description="A float field")
+        boolean_field: bool = Field(description="A boolean field")
+        string_field: str = Field(description="A string field")
+    
+    return TypeTestModel
+
+
+@pytest.fixture(scope="session")
+def default_generator():
+    """Stateless DefaultQuestionGenerator shared across tests"""
+    return DefaultQuestionGenerator()
+
+
+@pytest.fixture(scope="session")
+def wide_model():
+    """Model with 50 independent fields, built once per session"""
+    return make_wide_model(50)
+
+
+@pytest.fixture(scope="session")
+def chain_model():
+    """Model with a 20-field dependency chain, built once per session"""
+    return make_chain_model(20)
+
+
+@pytest.fixture(scope="session")
+def form_template():
+    """Build one test-mode AIForm per model class and hand out unstarted copies
+    
+    Each call returns a shallow copy with its own field configs and context, so
+    configuring or starting it never leaks into the cached template.
+    """
+    templates = {}
+    
+    def get(model_class):
+        template = templates.get(model_class)
+        if template is None:
+            template = templates[model_class] = AIForm(model_class, test_mode=True)
+        return copy.copy(template)
+    
+    return get
+
+
 @pytest.fixture
 def simple_form(simple_user_model):
     """Basic form instance for testing (test mode enabled)"""
     return AIForm(simple_user_model, test_mode=True)
 
 
+@pytest.fixture(scope="module")
+async def started_simple_form(simple_user_model):
+    """Started simple form shared per module; deepcopy it before responding"""
+    form = AIForm(simple_user_model, test_mode=True)
+    await form.start()
+    return form
+
+
 @pytest.fixture
 def complex_form(complex_job_model):
     """Complex form instance for testing (test mode enabled)"""
     return AIForm(complex_job_model, test_mode=True)
 
 
-@pytest.fixture
-def all_conversation_modes():
-    """All conversation modes for parametrized testing"""
-    return [
-        ConversationMode.SEQUENTIAL,
-        ConversationMode.ONE_SHOT,
-        ConversationMode.CLUSTERED
-    ]
-
-
-@pytest.fixture
-def all_validation_strategies():
-    """All validation strategies for parametrized testing"""
-    return [
-        ValidationStrategy.IMMEDIATE,
-        ValidationStrategy.END_OF_CLUSTER,
-        ValidationStrategy.FINAL
-    ]
-
-
 @pytest.fixture
 def all_field_priorities():
     """All field priorities for parametrized testing"""
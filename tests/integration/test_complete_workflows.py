@@ -1,5 +1,4 @@
 """Integration tests for complete form workflows"""
-import pytest
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
@@ -11,7 +10,6 @@ from ai_forms.parsers.ai_parser import AIResponseParser
 class TestCompleteFormWorkflows:
     """Test complete end-to-end form workflows"""
     
-    @pytest.mark.asyncio
     async def test_simple_user_registration_workflow(self):
         """Test complete user registration workflow"""
         class UserRegistration(BaseModel):
@@ -53,7 +51,6 @@ class TestCompleteFormWorkflows:
         assert data.age == 28
         assert data.newsletter is True
     
-    @pytest.mark.asyncio
     async def test_job_application_workflow_with_dependencies(self):
         """Test job application workflow with field dependencies"""
         class JobApplication(BaseModel):
@@ -111,7 +108,6 @@ class TestCompleteFormWorkflows:
         assert response.is_complete
         assert response.data.salary_expectation == 90000
     
-    @pytest.mark.asyncio
     async def test_form_with_validation_recovery(self):
         """Test complete workflow with validation errors and recovery"""
         class ContactForm(BaseModel):
@@ -156,7 +152,6 @@ class TestCompleteFormWorkflows:
         assert response.data.age == 35
         assert response.data.message == "Hello, this is my message!"
     
-    @pytest.mark.asyncio
     async def test_survey_form_workflow(self):
         """Test survey form with various question types"""
         class SurveyForm(BaseModel):
@@ -204,7 +199,6 @@ class TestCompleteFormWorkflows:
 class TestCustomQuestionGeneratorIntegration:
     """Test integration with custom question generators"""
     
-    @pytest.mark.asyncio
     async def test_personalized_question_generator_workflow(self):
         """Test workflow with personalized question generation"""
         class PersonalizedGenerator(QuestionGenerator):
@@ -244,7 +238,6 @@ class TestCustomQuestionGeneratorIntegration:
         response = await form.respond("555-1234")
         assert response.is_complete
     
-    @pytest.mark.asyncio
     async def test_conditional_question_generator(self):
         """Test question generator that adapts based on previous answers"""
         class ConditionalGenerator(QuestionGenerator):
@@ -307,9 +300,8 @@ class TestFormModeIntegration:
         
         # Should order by priority: CRITICAL, HIGH, LOW
         expected_order = ["critical_priority", "high_priority", "low_priority"]
-        assert form._field_order == expected_order
+        assert list(form._field_order) == expected_order
     
-    @pytest.mark.asyncio
     async def test_clustered_mode_preparation(self):
         """Test clustered mode field grouping (preparation for future implementation)"""
         class ClusteredForm(BaseModel):
@@ -349,7 +341,6 @@ class TestFormModeIntegration:
 class TestRealWorldScenarios:
     """Test realistic real-world scenarios"""
     
-    @pytest.mark.asyncio
     async def test_customer_onboarding_scenario(self):
         """Test complete customer onboarding scenario"""
         class CustomerOnboarding(BaseModel):
@@ -403,7 +394,6 @@ class TestRealWorldScenarios:
         assert response.data.use_case == "Analytics and reporting"
         assert response.data.notifications is True
     
-    @pytest.mark.asyncio
     async def test_medical_intake_scenario(self):
         """Test medical intake form scenario with sensitive handling"""
         class MedicalIntake(BaseModel):
@@ -458,7 +448,6 @@ class TestRealWorldScenarios:
         assert response.is_complete
         assert response.data.pain_level is None
     
-    @pytest.mark.asyncio
     async def test_event_registration_scenario(self):
         """Test event registration with complex logic"""
         class EventRegistration(BaseModel):
@@ -513,7 +502,6 @@ class TestRealWorldScenarios:
 class TestAIWorkflowIntegration:
     """Test AI-powered workflow integration"""
     
-    @pytest.mark.asyncio
     async def test_ai_powered_user_registration(self):
         """Test complete user registration with AI"""
         class UserRegistration(BaseModel):
@@ -549,7 +537,6 @@ class TestAIWorkflowIntegration:
         assert data.age == 28
         assert data.newsletter is True  # Should parse "yes please" as True
     
-    @pytest.mark.asyncio
     async def test_ai_vs_default_workflow_comparison(self):
         """Compare AI and default workflows"""
         class SimpleForm(BaseModel):
@@ -587,7 +574,6 @@ class TestAIWorkflowIntegration:
         assert default_final.data.name == "Alice"
         assert ai_final.data.name == "Bob"
     
-    @pytest.mark.asyncio
     async def test_ai_contextual_questioning(self):
         """Test AI contextual question generation"""
         class ProfileForm(BaseModel):
@@ -612,7 +598,6 @@ class TestAIWorkflowIntegration:
         assert isinstance(second_question, str) and len(second_question) > 0
         assert first_question != second_question
     
-    @pytest.mark.asyncio
     async def test_ai_complex_type_parsing(self):
         """Test AI parsing of complex types"""
         class ComplexForm(BaseModel):
@@ -633,7 +618,6 @@ class TestAIWorkflowIntegration:
         # Just ensure no fatal errors
         assert response is not None
     
-    @pytest.mark.asyncio
     async def test_ai_error_recovery_workflow(self):
         """Test AI error recovery in workflow"""
         class ValidationForm(BaseModel):
@@ -659,7 +643,6 @@ class TestAIWorkflowIntegration:
 class TestAIWorkflowEdgeCases:
     """Test AI workflow edge cases"""
     
-    @pytest.mark.asyncio
     async def test_ai_form_with_mixed_ai_default_components(self):
         """Test form with AI generator but default parser"""
         class MixedForm(BaseModel):
@@ -681,7 +664,6 @@ class TestAIWorkflowEdgeCases:
         assert response.is_complete
         assert response.data.age == 25  # Default parser should work
     
-    @pytest.mark.asyncio
     async def test_ai_form_fallback_on_ai_failure(self):
         """Test fallback behavior when AI components fail"""
         class FallbackForm(BaseModel):
@@ -1,7 +1,11 @@
 """Test helper utilities"""
+import functools
 import os
+from types import SimpleNamespace
 from typing import Any, Dict
 
+from pydantic import BaseModel, Field, create_model
+
 
 def ensure_test_mode_environment():
     """Ensure test environment doesn't require API keys"""
@@ -33,4 +37,58 @@ def restore_environment(original_values: Dict[str, Any]):
 
 def is_ai_test_enabled() -> bool:
     """Check if AI integration tests should be run (when API key is available)"""
-    return bool(os.environ.get('OPENAI_API_KEY') or os.environ.get('ANTHROPIC_API_KEY'))
\ No newline at end of file
+    return bool(os.environ.get('OPENAI_API_KEY') or os.environ.get('ANTHROPIC_API_KEY'))
+
+
+@functools.lru_cache(maxsize=16)
+def make_wide_model(field_count: int) -> type[BaseModel]:
+    """Build (once per size) a model with field_count required string fields"""
+    return create_model(
+        f"Wide{field_count}Model",
+        **{
+            f"field_{i}": (str, Field(description=f"Field number {i}"))
+            for i in range(field_count)
+        }
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def make_chain_model(length: int) -> type[BaseModel]:
+    """Build (once per length) a model whose fields form one dependency chain
+
+    Fields are declared last-to-first and field_i depends on field_{i-1}, so only
+    dependency resolution can produce the order field_0 .. field_{length-1}.
+    """
+    names = tuple(f"field_{i}" for i in range(length))
+    return create_model(
+        f"Chain{length}Model",
+        **{
+            names[i]: (str, Field(
+                description=f"Chain link {i}",
+                json_schema_extra={"dependencies": (names[i - 1],)} if i else None
+            ))
+            for i in reversed(range(length))
+        }
+    )
+
+
+class ScriptedFormAgent:
+    """Stand-in for an AIForm agent that stores each answer as the next missing field
+    
+    The opening run (no message history) only greets; every later run stores its
+    input and marks the form complete once no fields are missing. Inputs are
+    recorded in ``inputs`` so tests can check which ones were consumed.
+    """
+    
+    def __init__(self):
+        self.inputs = []
+    
+    async def run(self, user_input, deps, message_history=None):
+        self.inputs.append(user_input)
+        if message_history is not None:
+            missing = [name for name in deps._field_order if name not in deps._collected_data]
+            if missing:
+                deps._collected_data[missing[0]] = user_input
+            deps._form_complete = len(missing) <= 1
+        messages = [*(message_history or ()), user_input]
+        return SimpleNamespace(output=f"Received: {user_input}", all_messages=lambda: messages)
@@ -6,17 +6,16 @@ from pydantic import BaseModel, Field
 from ai_forms import AIForm, ConversationMode, FieldPriority
 from ai_forms.generators.base import PydanticAIQuestionGenerator
 from ai_forms.parsers.ai_parser import AIResponseParser
+from ai_forms.types.config import FieldConfig
 
 
 class TestPydanticAIQuestionGenerator:
     """Test AI-powered question generation using TestModel"""
     
-    @pytest.mark.asyncio
     async def test_ai_question_generator_test_mode(self):
         """Test AI question generator in test mode"""
         generator = PydanticAIQuestionGenerator(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(
             name="email",
             field_type=str,
@@ -31,12 +30,10 @@ class TestPydanticAIQuestionGenerator:
         assert isinstance(question, str)
         assert len(question) > 0
         
-    @pytest.mark.asyncio
     async def test_ai_generator_with_context(self):
         """Test AI question generator with context"""
         generator = PydanticAIQuestionGenerator(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(
             name="age",
             field_type=int,
@@ -49,12 +46,10 @@ class TestPydanticAIQuestionGenerator:
         assert isinstance(question, str)
         assert len(question) > 0
     
-    @pytest.mark.asyncio
     async def test_ai_generator_custom_question_override(self):
         """Test that custom questions are used directly"""
         generator = PydanticAIQuestionGenerator(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(
             name="email",
             field_type=str,
@@ -66,7 +61,6 @@ class TestPydanticAIQuestionGenerator:
         question = await generator.generate_question(config, {})
         assert question == "What's your email?"
     
-    @pytest.mark.asyncio
     async def test_ai_generator_fallback_on_error(self):
         """Test fallback to DefaultQuestionGenerator on error"""
         # Create generator that will fail by running out of responses
@@ -75,7 +69,6 @@ class TestPydanticAIQuestionGenerator:
         # Exhaust all test responses to trigger fallback
         generator.response_index = len(generator.test_responses) + 1
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(
             name="name",
             field_type=str,
@@ -86,16 +79,27 @@ class TestPydanticAIQuestionGenerator:
         question = await generator.generate_question(config, {})
         assert question == "Please provide your name (Your name)"
 
+    async def test_ai_generator_reset(self):
+        """Test that reset rewinds the test-mode response sequence"""
+        generator = PydanticAIQuestionGenerator(test_mode=True)
+        
+        config = FieldConfig(name="name", field_type=str, description="Your name")
+        
+        first = await generator.generate_question(config, {})
+        await generator.generate_question(config, {})
+        
+        generator.reset()
+        assert generator.response_index == 0
+        assert await generator.generate_question(config, {}) == first
+
 
 class TestAIResponseParser:
     """Test AI-powered response parsing using TestModel"""
     
-    @pytest.mark.asyncio
     async def test_ai_parser_simple_types(self):
         """Test AI parser with simple types"""
         parser = AIResponseParser(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(name="age", field_type=int, description="Age in years")
         
         # TestModel should return something parseable
@@ -103,12 +107,10 @@ class TestAIResponseParser:
         # The exact result depends on TestModel behavior, just check it works
         assert result is not None
     
-    @pytest.mark.asyncio
     async def test_ai_parser_list_type(self):
         """Test AI parser with list types"""
         parser = AIResponseParser(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(
             name="skills", 
             field_type=List[str], 
@@ -120,45 +122,53 @@ class TestAIResponseParser:
         result = await parser.parse_response("Python, JavaScript, SQL", config)
         assert result is not None
     
-    @pytest.mark.asyncio
     async def test_ai_parser_simple_fallback(self):
         """Test simple parsing fallback for basic types"""
         parser = AIResponseParser(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(name="name", field_type=str, description="Your name")
         
         # Simple string should work with simple parsing
         result = await parser.parse_response("Alice Johnson", config)
         assert result == "Alice Johnson"
     
-    @pytest.mark.asyncio
-    async def test_ai_parser_boolean_variations(self):
+    async def test_ai_parser_skips_ai_for_simple_types(self):
+        """Test that simple types never reach the AI parser, including falsy results"""
+        class NoAIParser(AIResponseParser):
+            async def _ai_parse(self, user_input, field_config, context):
+                raise AssertionError("AI parser should not be called")
+        
+        parser = NoAIParser(test_mode=True)
+        
+        bool_config = FieldConfig(name="subscribe", field_type=bool, description="Subscribe")
+        int_config = FieldConfig(name="count", field_type=int, description="Count")
+        list_config = FieldConfig(name="tags", field_type=List[str], description="Tags")
+        
+        assert await parser.parse_response("off", bool_config) is False
+        assert await parser.parse_response("0", int_config) == 0
+        assert await parser.parse_response("", list_config) == []
+    
+    @pytest.mark.parametrize("input_val,expected", [
+        ("yes", True),
+        ("no", False),
+        ("true", True),
+        ("false", False),
+        ("1", True),
+        ("0", False)
+    ])
+    async def test_ai_parser_boolean_variations(self, input_val, expected):
         """Test boolean parsing with various inputs"""
         parser = AIResponseParser(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(name="subscribe", field_type=bool, description="Subscribe to newsletter")
         
-        # Test various boolean inputs
-        test_cases = [
-            ("yes", True),
-            ("no", False),
-            ("true", True),
-            ("false", False),
-            ("1", True),
-            ("0", False)
-        ]
-        
-        for input_val, expected in test_cases:
-            result = await parser.parse_response(input_val, config)
-            assert result == expected
+        result = await parser.parse_response(input_val, config)
+        assert result == expected
 
 
 class TestAIFormIntegration:
     """Test AIForm with AI components using TestModel"""
     
-    @pytest.mark.asyncio
     async def test_ai_form_basic_workflow(self):
         """Test basic AI form workflow with TestModel"""
         class SimpleModel(BaseModel):
@@ -181,7 +191,6 @@ class TestAIFormIntegration:
         response = await form.respond("Alice Johnson")
         assert not response.is_complete or response.current_field != "name"
     
-    @pytest.mark.asyncio
     async def test_ai_form_vs_default_form(self, simple_user_model):
         """Compare AI form with default form behavior"""
         # Default form (use test_mode for unit tests)
@@ -204,7 +213,6 @@ class TestAIFormIntegration:
         assert len(default_response.question) > 0
         assert len(ai_response.question) > 0
     
-    @pytest.mark.asyncio
     async def test_ai_form_fallback_behavior(self, simple_user_model):
         """Test AI form fallback to simple parsing"""
         form = AIForm(simple_user_model, use_ai=True, test_mode=True)
@@ -223,7 +231,6 @@ class TestAIFormIntegration:
 class TestAIFormComplexTypes:
     """Test AI form with complex field types"""
     
-    @pytest.mark.asyncio
     async def test_list_field_parsing(self):
         """Test AI parsing of list fields"""
         class ModelWithList(BaseModel):
@@ -240,7 +247,6 @@ class TestAIFormComplexTypes:
         response = await form.respond("Python, JavaScript, SQL")
         assert not response.errors or len(response.errors) == 0
     
-    @pytest.mark.asyncio
     async def test_optional_field_handling(self):
         """Test handling of optional fields"""
         class ModelWithOptional(BaseModel):
@@ -265,13 +271,10 @@ class TestAIFormComplexTypes:
 class TestAIMockResponses:
     """Test AI with predefined mock responses for specific scenarios"""
     
-    @pytest.mark.asyncio
     async def test_contextual_question_generation(self):
         """Test that context influences question generation"""
         generator = PydanticAIQuestionGenerator(test_mode=True)
         
-        from ai_forms.types.config import FieldConfig
-        
         # Test question without context
         config = FieldConfig(name="phone", field_type=str, description="Phone number")
         question1 = await generator.generate_question(config, {})
@@ -284,7 +287,6 @@ class TestAIMockResponses:
         assert isinstance(question1, str) and len(question1) > 0
         assert isinstance(question2, str) and len(question2) > 0
     
-    @pytest.mark.asyncio
     async def test_ai_error_recovery(self):
         """Test AI error recovery and fallback"""
         class ErrorProneParser(AIResponseParser):
@@ -300,7 +302,6 @@ class TestAIMockResponses:
         
         parser = ErrorProneParser()
         
-        from ai_forms.types.config import FieldConfig
         config = FieldConfig(name="name", field_type=str, description="Your name")
         
         # Should handle error and potentially retry or fallback
@@ -9,6 +9,22 @@ from ai_forms.types.config import FieldConfig
 from ai_forms.types.enums import FieldPriority
 
 
+# Form models shared by the AIForm integration tests, built once at import
+class ContactModel(BaseModel):
+    name: str = Field(description="Full name")
+    email: str = Field(description="Email address", json_schema_extra={"validation_hint": "email validation"})
+    age: int = Field(description="Age in years")
+
+
+class EmailModel(BaseModel):
+    email: str = Field(description="Email address", json_schema_extra={"validation_hint": "email validation"})
+
+
+class NameAgeModel(BaseModel):
+    name: str = Field(description="Name")
+    age: int = Field(description="Age")
+
+
 class TestAIValidationTools:
     """Test AI validation tools in test mode"""
     
@@ -78,7 +94,16 @@ class TestAIValidationTools:
         
         assert result.is_valid is False
         assert "Expected a number" in result.error_message
-    
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("42", 42), ("-7", -7), ("+3", 3), ("1,000", 1000),
+        ("1_000", 1000), (" 12 ", 12), ("twelve", 12), ("Five", 5),
+    ])
+    def test_integer_parsing_formats(self, raw, expected):
+        """Test integer parsing across digit, separator and word formats"""
+        tools = AIValidationTools(test_mode=True)
+        assert tools._parse_integer(raw) == expected
+
     def test_form_validation_tool_basic(self):
         """Test basic form validation tool"""
         tools = AIValidationTools(test_mode=True)
@@ -135,17 +160,10 @@ class TestAIValidationTools:
 class TestAIFormWithValidationTools:
     """Test AIForm integration with AI validation tools"""
     
-    @pytest.mark.asyncio
     async def test_ai_form_with_validation_tools(self):
         """Test AIForm using AI validation tools as primary validation"""
-        
-        class TestModel(BaseModel):
-            name: str = Field(description="Full name")
-            email: str = Field(description="Email address", json_schema_extra={"validation_hint": "email validation"})
-            age: int = Field(description="Age in years")
-        
         # Create form with AI validation tools in test mode
-        form = AIForm(TestModel, use_ai=True, test_mode=True)
+        form = AIForm(ContactModel, use_ai=True, test_mode=True)
         await form.start()
         
         # Test valid inputs
@@ -164,14 +182,9 @@ class TestAIFormWithValidationTools:
         assert response.data.email == "john@example.com"
         assert response.data.age == 30
     
-    @pytest.mark.asyncio
     async def test_ai_form_validation_tools_field_error(self):
         """Test AIForm validation tools catching field errors"""
-        
-        class TestModel(BaseModel):
-            email: str = Field(description="Email address", json_schema_extra={"validation_hint": "email validation"})
-        
-        form = AIForm(TestModel, use_ai=True, test_mode=True)
+        form = AIForm(EmailModel, use_ai=True, test_mode=True)
         await form.start()
         
         # Test invalid email - should be caught by AI validation tools
@@ -190,16 +203,10 @@ class TestAIFormWithValidationTools:
             # Form completed, error should be in final validation
             assert response.is_complete
     
-    @pytest.mark.asyncio
     async def test_ai_form_fallback_when_no_ai_tools(self):
         """Test AIForm falls back to basic validation when AI tools unavailable"""
-        
-        class TestModel(BaseModel):
-            name: str = Field(description="Name")
-            age: int = Field(description="Age")
-        
         # Create form without AI tools (use_ai=False)
-        form = AIForm(TestModel, use_ai=False)
+        form = AIForm(NameAgeModel, use_ai=False)
         await form.start()
         
         # Should still work with basic validation
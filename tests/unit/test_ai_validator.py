@@ -1,4 +1,5 @@
 """Test suite for AiValidator with fallback and mock scenarios"""
+import sys
 import pytest
 from unittest.mock import patch, MagicMock
 from pydantic import BaseModel, Field
@@ -49,7 +50,6 @@ class TestAiValidatorCore:
         assert status["use_ai"] is False
         assert status["ai_enabled"] is False
     
-    @pytest.mark.asyncio
     async def test_field_validation_with_ai(self):
         """Test field validation with AI enabled"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -69,7 +69,6 @@ class TestAiValidatorCore:
         result = await validator.validate_field(config, "nope", {})
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_field_validation_fallback(self):
         """Test field validation fallback when AI is disabled"""
         validator = AiValidator(use_ai=False, test_mode=True)
@@ -97,7 +96,6 @@ class TestAiValidatorCore:
 class TestAiValidatorFieldTypes:
     """Test AiValidator with different field types"""
     
-    @pytest.mark.asyncio
     async def test_integer_validation(self):
         """Test integer field validation"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -123,7 +121,6 @@ class TestAiValidatorFieldTypes:
         with pytest.raises(ValidationError, match="Expected a number"):
             await validator.validate_field(config, "not a number", {})
     
-    @pytest.mark.asyncio
     async def test_list_validation(self):
         """Test list field validation"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -149,7 +146,6 @@ class TestAiValidatorFieldTypes:
         result = await validator.validate_field(config, "", {})
         assert result == []
     
-    @pytest.mark.asyncio
     async def test_email_validation(self):
         """Test email field validation"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -175,7 +171,6 @@ class TestAiValidatorFieldTypes:
 class TestAiValidatorFormValidation:
     """Test AiValidator form-level validation"""
     
-    @pytest.mark.asyncio
     async def test_form_validation_success(self):
         """Test successful form validation"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -199,7 +194,6 @@ class TestAiValidatorFormValidation:
         result = await validator.validate_form(form_data, UserTestModel, field_configs)
         assert result == form_data
     
-    @pytest.mark.asyncio
     async def test_form_validation_fallback(self):
         """Test form validation fallback when AI is disabled"""
         validator = AiValidator(use_ai=False, test_mode=True)
@@ -222,7 +216,6 @@ class TestAiValidatorFormValidation:
 class TestAiValidatorMockScenarios:
     """Test AiValidator with mocked AI components"""
     
-    @pytest.mark.asyncio
     async def test_ai_validation_tools_failure_fallback(self):
         """Test fallback when AI validation tools fail"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -244,7 +237,6 @@ class TestAiValidatorMockScenarios:
             assert result == 25
             assert isinstance(result, int)
     
-    @pytest.mark.asyncio
     async def test_ai_validation_tools_none(self):
         """Test behavior when AI validation tools are None"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -266,7 +258,18 @@ class TestAiValidatorMockScenarios:
         with pytest.raises(ValidationError, match="Expected yes/no, got: sure"):
             await validator.validate_field(config, "sure", {})
     
-    @pytest.mark.asyncio
+    async def test_ai_validator_without_pydantic_ai(self, monkeypatch):
+        """Test that AiValidator degrades to simple parsing when AI tools cannot be imported"""
+        # A None entry in sys.modules makes the lazy import raise ImportError
+        monkeypatch.setitem(sys.modules, "ai_forms.validators.ai_tools", None)
+        
+        validator = AiValidator(use_ai=True, test_mode=True)
+        assert validator.ai_validation_tools is None
+        assert not validator.is_ai_enabled
+        
+        config = FieldConfig(name="age", field_type=int, description="Age")
+        assert await validator.validate_field(config, "25", {}) == 25
+    
     async def test_form_validation_ai_failure(self):
         """Test form validation when AI fails"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -286,7 +289,6 @@ class TestAiValidatorMockScenarios:
 class TestAiValidatorEdgeCases:
     """Test AiValidator edge cases and error scenarios"""
     
-    @pytest.mark.asyncio
     async def test_validation_error_propagation(self):
         """Test that ValidationErrors are properly propagated"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -335,7 +337,6 @@ class TestAiValidatorEdgeCases:
 class TestAiValidatorIntegration:
     """Integration tests for AiValidator with realistic scenarios"""
     
-    @pytest.mark.asyncio
     async def test_complete_form_workflow_with_ai(self):
         """Test complete form workflow with AI validation"""
         validator = AiValidator(use_ai=True, test_mode=True)
@@ -373,7 +374,6 @@ class TestAiValidatorIntegration:
         final_data = await validator.validate_form(collected_data, UserForm, field_configs)
         assert final_data == collected_data
     
-    @pytest.mark.asyncio
     async def test_complete_form_workflow_without_ai(self):
         """Test complete form workflow without AI (fallback mode)"""
         validator = AiValidator(use_ai=False, test_mode=True)
@@ -1,10 +1,40 @@
-"""Core AIForm class tests"""
+"""Core AIForm class tests
+
+Tests marked ``perf`` are skipped unless ``--run-perf`` is given. They share one
+xdist group; run them in parallel with ``pytest --run-perf -n auto --dist=loadgroup``.
+"""
+import asyncio
+import copy
 import pytest
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pydantic import BaseModel, Field
 
 from ai_forms import AIForm, ConversationMode, FieldPriority, ValidationStrategy
 from ai_forms.types.exceptions import ConfigurationError, ValidationError
+from ..test_helpers import ScriptedFormAgent, make_wide_model
+
+# Allocation budget for one 50-field form built from the cached field plan
+MAX_BYTES_PER_FORM = 64 * 1024
+
+# Canonical orders for the session wide_model and chain_model fixtures
+WIDE_ORDER = tuple(f"field_{i}" for i in range(50))
+CHAIN_ORDER = tuple(f"field_{i}" for i in range(20))
+
+# Answers for a 10-field wide model, materialized once
+WIDE_FIELD_VALUES = tuple(f"value_{i}" for i in range(10))
+
+# Large metadata built once per session rather than inside each test
+BIG_EXAMPLES = tuple(["example1", "example2"] * 100)
+BIG_NESTED = {"nested": {"deeply": {"nested": {"data": tuple(range(1000))}}}}
+
+
+class HeavyMetadataModel(BaseModel):
+    value: str = Field(
+        description="Field with large metadata",
+        json_schema_extra={"examples": BIG_EXAMPLES, "custom_data": BIG_NESTED}
+    )
 
 
 class TestAIFormInitialization:
@@ -20,17 +50,17 @@ class TestAIFormInitialization:
         assert len(form._field_configs) == 3
         assert not form._started
     
-    def test_form_initialization_with_modes(self, simple_user_model, all_conversation_modes):
+    @pytest.mark.parametrize("mode", list(ConversationMode))
+    def test_form_initialization_with_modes(self, simple_user_model, mode):
         """Test initialization with different conversation modes"""
-        for mode in all_conversation_modes:
-            form = AIForm(simple_user_model, mode=mode, test_mode=True)
-            assert form.mode == mode
+        form = AIForm(simple_user_model, mode=mode, test_mode=True)
+        assert form.mode == mode
     
-    def test_form_initialization_with_validation_strategies(self, simple_user_model, all_validation_strategies):
+    @pytest.mark.parametrize("strategy", list(ValidationStrategy))
+    def test_form_initialization_with_validation_strategies(self, simple_user_model, strategy):
         """Test initialization with different validation strategies"""
-        for strategy in all_validation_strategies:
-            form = AIForm(simple_user_model, validation=strategy, test_mode=True)
-            assert form.validation == strategy
+        form = AIForm(simple_user_model, validation=strategy, test_mode=True)
+        assert form.validation == strategy
     
     def test_form_with_empty_model(self, empty_model):
         """Test form with model that has no fields"""
@@ -43,6 +73,70 @@ class TestAIFormInitialization:
         with pytest.raises(ConfigurationError, match="Circular dependency"):
             AIForm(circular_dependency_model, test_mode=True)
     
+    def test_form_with_self_dependency(self):
+        """Test that a field depending on itself is reported as circular"""
+        class SelfDependentModel(BaseModel):
+            name: str = Field(description="Name")
+            loop: str = Field(
+                description="Depends on itself",
+                json_schema_extra={"dependencies": ["loop"]}
+            )
+        
+        with pytest.raises(ConfigurationError, match="Circular dependency involving fields: loop"):
+            AIForm(SelfDependentModel, test_mode=True)
+    
+    def test_form_with_many_fields(self, wide_model):
+        """Test initialization with a wide model keeps model order"""
+        form = AIForm(wide_model, test_mode=True)
+        
+        assert len(form._field_configs) == 50
+        assert form._field_order == WIDE_ORDER
+    
+    @pytest.mark.perf
+    def test_form_memory_footprint(self, wide_model):
+        """Test per-form allocations stay within budget once the field plan is cached"""
+        AIForm(wide_model, test_mode=True)
+        
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            forms = [AIForm(wide_model, test_mode=True) for _ in range(100)]
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "lineno"))
+        assert len(forms) == 100
+        assert allocated < len(forms) * MAX_BYTES_PER_FORM
+    
+    @pytest.mark.perf
+    def test_form_initialization_benchmark(self, request, simple_user_model):
+        """Benchmark form construction from a cached field plan"""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+        benchmark.group = "init"
+        benchmark.extra_info["fields"] = 3
+        
+        form = benchmark.pedantic(
+            AIForm, args=(simple_user_model,), kwargs={"test_mode": True},
+            iterations=100, rounds=10, warmup_rounds=1
+        )
+        
+        assert form.model_class is simple_user_model
+    
+    @pytest.mark.perf
+    def test_dependency_resolution_benchmark(self, request, chain_model):
+        """Benchmark field ordering for a 20-field dependency chain"""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+        benchmark.group = "ordering"
+        benchmark.extra_info["fields"] = 20
+        form = AIForm(chain_model, test_mode=True)
+        
+        order = benchmark(form._calculate_field_order)
+        
+        assert order == CHAIN_ORDER
+    
     def test_field_extraction_from_pydantic_model(self, complex_job_model):
         """Test that field configurations are properly extracted"""
         form = AIForm(complex_job_model, test_mode=True)
@@ -75,7 +169,7 @@ class TestAIFormFieldOrdering:
         
         # Critical should come first, then high, then low
         expected_order = ["age", "email", "name"]
-        assert form._field_order == expected_order
+        assert list(form._field_order) == expected_order
     
     def test_field_ordering_with_dependencies(self, complex_job_model):
         """Test fields respect dependency ordering"""
@@ -104,7 +198,51 @@ class TestAIFormFieldOrdering:
         form = AIForm(TestModel, test_mode=True)
         
         # low_priority must come first despite lower priority due to dependency
-        assert form._field_order == ["low_priority", "depends_on_low"]
+        assert list(form._field_order) == ["low_priority", "depends_on_low"]
+    
+    def test_field_ordering_long_dependency_chain(self, chain_model):
+        """Test a long chain declared in reverse resolves to chain order"""
+        form = AIForm(chain_model, test_mode=True)
+        
+        assert form._field_order == CHAIN_ORDER
+    
+    def test_field_plan_shared_across_forms(self, simple_user_model):
+        """Test that forms over the same model do not share mutable configs"""
+        first = AIForm(simple_user_model, test_mode=True)
+        first.configure_field("age", priority=FieldPriority.CRITICAL)
+        
+        second = AIForm(simple_user_model, test_mode=True)
+        
+        assert list(first._field_order) == ["age", "name", "email"]
+        assert list(second._field_order) == ["name", "email", "age"]
+        assert second._field_configs["age"].priority == FieldPriority.MEDIUM
+        assert second._field_configs["age"] is not first._field_configs["age"]
+        assert AIForm(simple_user_model, test_mode=True)._field_order is second._field_order
+
+    @pytest.mark.perf
+    def test_field_plan_concurrent_construction(self, wide_model):
+        """Test forms built from several threads each get independent configs"""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            forms = list(executor.map(lambda _: AIForm(wide_model, test_mode=True), range(100)))
+        
+        assert len(forms) == 100
+        assert len({id(form._field_configs["field_0"]) for form in forms}) == 100
+        assert all(list(form._field_order) == list(forms[0]._field_order) for form in forms)
+
+    def test_model_examples_shared_across_forms(self, complex_job_model):
+        """Test that model-declared examples are frozen and not copied per form"""
+        first = AIForm(complex_job_model, test_mode=True)
+        second = AIForm(complex_job_model, test_mode=True)
+
+        assert first._field_configs["skills"].examples == ("Python", "JavaScript", "Project Management")
+        assert first._field_configs["skills"].examples is second._field_configs["skills"].examples
+
+    def test_large_field_metadata(self):
+        """Test that large example lists are carried without per-form copies"""
+        form = AIForm(HeavyMetadataModel, test_mode=True)
+        
+        assert len(form._field_configs["value"].examples) == 200
+        assert form._field_configs["value"].examples is BIG_EXAMPLES
 
 
 class TestAIFormConfiguration:
@@ -122,6 +260,56 @@ class TestAIFormConfiguration:
         assert form._field_configs["email"].custom_question == "What's your email?"
         assert form._field_configs["age"].examples == ["25", "30", "35"]
     
+    def test_configure_bulk_interface(self, simple_user_model):
+        """Test configuring several fields with a single call"""
+        form = AIForm(simple_user_model, test_mode=True).configure({
+            "name": {"priority": FieldPriority.LOW},
+            "email": {"custom_question": "What's your email?"},
+            "age": {"priority": FieldPriority.CRITICAL, "examples": ["25", "30"]}
+        })
+        
+        assert form._field_configs["email"].custom_question == "What's your email?"
+        assert form._field_configs["age"].examples == ["25", "30"]
+        assert list(form._field_order) == ["age", "email", "name"]
+    
+    def test_configure_bulk_nonexistent_field(self, simple_user_model):
+        """Test that a bulk update with an unknown field applies nothing"""
+        form = AIForm(simple_user_model, test_mode=True)
+        
+        with pytest.raises(ConfigurationError, match="Field 'nonexistent' not found"):
+            form.configure({
+                "name": {"priority": FieldPriority.CRITICAL},
+                "nonexistent": {"priority": FieldPriority.HIGH}
+            })
+        assert form._field_configs["name"].priority == FieldPriority.MEDIUM
+
+    def test_configure_bulk_invalid_priority_is_atomic(self, simple_user_model):
+        """Test that a bad priority later in a batch applies nothing"""
+        form = AIForm(simple_user_model, test_mode=True)
+        order_before = list(form._field_order)
+
+        with pytest.raises(ValueError, match="Priority must be a FieldPriority"):
+            form.configure({
+                "email": {"priority": FieldPriority.CRITICAL},
+                "name": {"priority": "high"}
+            })
+        assert form._field_configs["email"].priority == FieldPriority.MEDIUM
+        assert form._field_configs["name"].priority == FieldPriority.MEDIUM
+        assert list(form._field_order) == order_before
+
+    def test_configure_bulk_unknown_option_is_atomic(self, simple_user_model):
+        """Test that a misspelled option later in a batch applies nothing"""
+        form = AIForm(simple_user_model, test_mode=True)
+        order_before = list(form._field_order)
+
+        with pytest.raises(ConfigurationError, match="Unknown configuration option.*prioirty"):
+            form.configure({
+                "email": {"priority": FieldPriority.CRITICAL},
+                "name": {"prioirty": FieldPriority.HIGH}
+            })
+        assert form._field_configs["email"].priority == FieldPriority.MEDIUM
+        assert list(form._field_order) == order_before
+
     def test_configure_nonexistent_field(self, simple_user_model):
         """Test configuring non-existent field raises error"""
         form = AIForm(simple_user_model, test_mode=True)
@@ -132,7 +320,7 @@ class TestAIFormConfiguration:
     def test_field_reconfiguration_updates_ordering(self, simple_user_model):
         """Test that reconfiguring field priority updates ordering"""
         form = AIForm(simple_user_model, test_mode=True)
-        original_order = form._field_order.copy()
+        original_order = form._field_order
         
         # Change priority of last field to critical
         last_field = original_order[-1]
@@ -141,6 +329,16 @@ class TestAIFormConfiguration:
         # Should now be first
         assert form._field_order[0] == last_field
     
+    def test_configure_field_defers_reordering(self, simple_user_model):
+        """Test that field order is only recalculated when next read"""
+        form = (AIForm(simple_user_model, test_mode=True)
+                .configure_field("age", priority=FieldPriority.CRITICAL)
+                .configure_field("email", priority=FieldPriority.HIGH))
+        
+        assert form._order_dirty
+        assert list(form._field_order) == ["age", "email", "name"]
+        assert not form._order_dirty
+    
     def test_context_setting(self, simple_user_model):
         """Test context setting functionality"""
         form = AIForm(simple_user_model, test_mode=True)
@@ -159,7 +357,6 @@ class TestAIFormConfiguration:
 class TestAIFormLifecycle:
     """Test form lifecycle and state management"""
     
-    @pytest.mark.asyncio
     async def test_form_start(self, simple_form):
         """Test form start functionality"""
         response = await simple_form.start()
@@ -172,7 +369,6 @@ class TestAIFormLifecycle:
         assert response.current_field is not None
         assert len(response.collected_fields) == 0
     
-    @pytest.mark.asyncio
     async def test_form_start_empty_model(self, empty_model):
         """Test starting form with empty model"""
         form = AIForm(empty_model, test_mode=True)
@@ -182,13 +378,157 @@ class TestAIFormLifecycle:
         assert response.progress == 100.0
         assert response.data is not None
     
-    @pytest.mark.asyncio
+    @pytest.mark.perf
+    @pytest.mark.parametrize("form_count,max_concurrency", [(10, 8), (100, 16)])
+    async def test_concurrent_form_starts(self, simple_user_model, form_count, max_concurrency):
+        """Test many forms can be started concurrently without sharing state"""
+        reference = AIForm(simple_user_model, test_mode=True)
+        expected = await reference.start()
+        forms = [AIForm(simple_user_model, test_mode=True) for _ in range(form_count)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def start(form):
+            async with semaphore:
+                return await form.start()
+        
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(start(form)) for form in forms]
+        
+        responses = [task.result() for task in tasks]
+        assert all(form._started for form in forms)
+        assert all(not response.is_complete for response in responses)
+        # Each form sees exactly what a form started on its own sees
+        assert all(response.question == expected.question for response in responses)
+        history_length = len(reference._conversation_history)
+        assert all(len(form._conversation_history) == history_length for form in forms)
+    
+    async def test_respond_after_completion(self, empty_model):
+        """Test that input after completion returns the cached final response"""
+        form = AIForm(empty_model, test_mode=True)
+        final = await form.start()
+        
+        response = await form.respond("extra input")
+        
+        assert response is final
+        assert response.is_complete
+    
+    async def test_restart_after_completion(self, simple_form):
+        """Test starting a completed form again runs a new conversation"""
+        simple_form.agent = agent = ScriptedFormAgent()
+        await simple_form.start()
+        final = await simple_form.respond_many(["Alice", "alice@example.com", "25"])
+        assert final.is_complete
+        
+        restarted = await simple_form.start()
+        response = await simple_form.respond("Bob")
+        
+        assert not restarted.is_complete
+        assert response is not final
+        assert agent.inputs[-1] == "Bob"
+    
+    async def test_respond_many(self, simple_form):
+        """Test batched responses are processed in order through the agent"""
+        simple_form.agent = agent = ScriptedFormAgent()
+        await simple_form.start()
+        
+        await simple_form.respond_many(["Alice", "alice@example.com"])
+        
+        assert agent.inputs == ["Hello", "Alice", "alice@example.com"]
+        assert simple_form._collected_data == {"name": "Alice", "email": "alice@example.com"}
+    
+    @pytest.mark.perf
+    async def test_respond_many_repeated_invalid_input(self, simple_form):
+        """Test a long run of invalid input leaves collected data bounded"""
+        await simple_form.start()
+        
+        response = await simple_form.respond_many(["invalid age input"] * 100)
+        
+        assert not response.is_complete
+        assert not simple_form._form_complete
+        assert "age" not in simple_form._collected_data
+    
+    async def test_respond_many_stops_when_complete(self):
+        """Test batched responses stop at completion and return the final response"""
+        form = AIForm(make_wide_model(2), test_mode=True)
+        form.agent = agent = ScriptedFormAgent()
+        await form.start()
+        
+        respond = form.respond
+        consumed = []
+        
+        async def counting_respond(user_input):
+            consumed.append(user_input)
+            return await respond(user_input)
+        
+        form.respond = counting_respond
+        response = await form.respond_many(["first", "second", "third"])
+        
+        assert response.is_complete
+        assert response is form._final_response
+        assert response.data.field_1 == "second"
+        # The third input is never consumed, so the agent and history never see it
+        assert consumed == ["first", "second"]
+        assert agent.inputs == ["Hello", "first", "second"]
+        assert "third" not in form._conversation_history
+    
+    async def test_respond_many_requires_input(self, simple_form):
+        """Test an empty batch is rejected"""
+        with pytest.raises(ValueError, match="at least one input"):
+            await simple_form.respond_many([])
+    
+    async def test_form_copy(self, simple_form):
+        """Test copying a started form gives a fresh form with the same configuration"""
+        simple_form.configure_field("age", priority=FieldPriority.CRITICAL)
+        await simple_form.start()
+        simple_form._collected_data["name"] = "Alice"
+        
+        clone = copy.copy(simple_form)
+        
+        assert clone.model_class is simple_form.model_class
+        assert clone.agent is simple_form.agent
+        assert clone._field_order is simple_form._field_order
+        assert clone._field_configs["age"].priority == FieldPriority.CRITICAL
+        assert not clone._started
+        assert clone._collected_data == {}
+        
+        clone.configure_field("name", priority=FieldPriority.LOW)
+        assert simple_form._field_configs["name"].priority == FieldPriority.MEDIUM
+    
+    async def test_form_deepcopy_snapshot(self, started_simple_form):
+        """Test deep copies of a started form continue independently"""
+        first = copy.deepcopy(started_simple_form)
+        second = copy.deepcopy(started_simple_form)
+        
+        assert first._started
+        assert first.agent is started_simple_form.agent
+        assert first._conversation_history == started_simple_form._conversation_history
+        assert first._conversation_history is not started_simple_form._conversation_history
+        
+        first._collected_data["name"] = "Alice"
+        await first.respond("Alice")
+        
+        assert second._collected_data == {}
+        assert len(second._conversation_history) == len(started_simple_form._conversation_history)
+    
+    async def test_form_reset(self, simple_form):
+        """Test reset clears runtime state but keeps field configuration"""
+        await simple_form.start()
+        simple_form._collected_data["name"] = "Alice"
+        simple_form._form_complete = True
+        
+        simple_form.reset()
+        
+        assert not simple_form._started
+        assert not simple_form._form_complete
+        assert simple_form._collected_data == {}
+        assert simple_form._conversation_history == []
+        assert list(simple_form._field_configs) == ["name", "email", "age"]
+    
     async def test_respond_before_start(self, simple_form):
         """Test responding before starting raises error"""
         with pytest.raises(ConfigurationError, match="Form not started"):
             await simple_form.respond("test input")
     
-    @pytest.mark.asyncio
     async def test_complete_form_flow(self, simple_form):
         """Test complete form flow"""
         # Start form
@@ -215,7 +555,6 @@ class TestAIFormLifecycle:
         assert response.data.email == "alice@email.com"
         assert response.data.age == 28
     
-    @pytest.mark.asyncio
     async def test_skip_condition_handling(self, complex_job_model):
         """Test skip condition logic"""
         form = AIForm(complex_job_model, test_mode=True)
@@ -233,7 +572,6 @@ class TestAIFormLifecycle:
         # salary_expectation should have been skipped
         assert "salary_expectation" not in form._collected_data
     
-    @pytest.mark.asyncio
     async def test_progress_calculation(self, simple_form):
         """Test progress calculation accuracy"""
         await simple_form.start()
@@ -251,12 +589,31 @@ class TestAIFormLifecycle:
         # After final field
         response = await simple_form.respond("25")
         assert response.progress == 100.0
+    
+    def test_collected_data_growth(self, form_template):
+        """Test storing every field grows collected data by exactly one entry each"""
+        form = form_template(make_wide_model(10))
+        
+        for count, (field_name, value) in enumerate(zip(form._field_order, WIDE_FIELD_VALUES), start=1):
+            form._store_field_value_impl(field_name, value)
+            assert len(form._collected_data) == count
+        
+        assert form._collected_data == dict(zip(form._field_order, WIDE_FIELD_VALUES))
+        assert form._form_complete
+
+
+async def _validate_many(form, field_name, inputs):
+    """Validate independent inputs for one field concurrently, returning values or errors"""
+    config = form._field_configs[field_name]
+    return await asyncio.gather(
+        *(form.ai_validator.validate_field(config, user_input, {}) for user_input in inputs),
+        return_exceptions=True
+    )
 
 
 class TestAIFormErrorHandling:
     """Test error handling scenarios"""
     
-    @pytest.mark.asyncio
     async def test_validation_error_handling(self, simple_form):
         """Test handling of validation errors"""
         await simple_form.start()
@@ -271,7 +628,6 @@ class TestAIFormErrorHandling:
         assert not response.is_complete
         assert "Expected a number" in response.errors[0]
     
-    @pytest.mark.asyncio
     async def test_pydantic_validation_integration(self, simple_user_model):
         """Test integration with Pydantic model validation"""
         class StrictModel(BaseModel):
@@ -286,7 +642,6 @@ class TestAIFormErrorHandling:
         # Should catch the validation error
         assert len(response.errors) > 0
     
-    @pytest.mark.asyncio
     async def test_multiple_validation_attempts(self, simple_form):
         """Test multiple validation failure attempts"""
         await simple_form.start()
@@ -301,4 +656,15 @@ class TestAIFormErrorHandling:
         assert len(response1.errors) > 0
         assert len(response2.errors) > 0
         assert response3.is_complete
-        assert response3.data.age == 25
\ No newline at end of file
+        assert response3.data.age == 25
+    
+    async def test_independent_validation_attempts(self, simple_form):
+        """Test validation of several candidate inputs for the same field"""
+        invalid1, invalid2, valid = await _validate_many(
+            simple_form, "age", ["invalid age", "still invalid", "25"]
+        )
+        
+        assert isinstance(invalid1, ValidationError)
+        assert isinstance(invalid2, ValidationError)
+        assert "Expected a number" in str(invalid1)
+        assert valid == 25
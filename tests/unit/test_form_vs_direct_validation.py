@@ -1,5 +1,4 @@
 """Test form vs direct validation to identify the discrepancy"""
-import pytest
 import asyncio
 from pydantic import BaseModel, Field
 
@@ -32,7 +31,6 @@ class TestFormVsDirectValidation:
         assert result.parsed_value is True
         assert result.error_message is None
     
-    @pytest.mark.asyncio
     async def test_form_validation_boolean_sure(self):
         """Test form validation with 'sure' - currently failing"""
         form = AIForm(SimpleTestModel, use_ai=True, test_mode=True)
@@ -62,7 +60,6 @@ class TestFormVsDirectValidation:
             assert response.is_complete is True
             assert response.data.newsletter is True
     
-    @pytest.mark.asyncio
     async def test_form_field_parsing_direct_call(self):
         """Test the form's _parse_field_value method directly"""
         form = AIForm(SimpleTestModel, use_ai=True, test_mode=True)
@@ -80,26 +77,21 @@ class TestFormVsDirectValidation:
             print(f"Direct field parsing failed: {e}")
             raise
     
-    def test_simple_field_parsing_fallback(self):
+    async def test_simple_field_parsing_fallback(self):
         """Test that AI validator fallback works when AI is disabled"""
         form = AIForm(SimpleTestModel, use_ai=False, test_mode=True)
         field_config = form._field_configs['newsletter']
         
         # Test the AI validator in non-AI mode (should use simple parsing)
-        async def test_fallback():
-            try:
-                parsed_value = await form.ai_validator.validate_field(field_config, "sure", {})
-                print(f"Non-AI validation result: {parsed_value}")
-                # This SHOULD fail since simple parsing doesn't understand 'sure'
-                assert False, "Non-AI validation should have failed with 'sure'"
-            except Exception as e:
-                print(f"Non-AI validation correctly failed with: {e}")
-                # This is expected - simple parsing should fail with 'sure'
-        
-        import asyncio
-        asyncio.run(test_fallback())
+        try:
+            parsed_value = await form.ai_validator.validate_field(field_config, "sure", {})
+            print(f"Non-AI validation result: {parsed_value}")
+            # This SHOULD fail since simple parsing doesn't understand 'sure'
+            assert False, "Non-AI validation should have failed with 'sure'"
+        except Exception as e:
+            print(f"Non-AI validation correctly failed with: {e}")
+            # This is expected - simple parsing should fail with 'sure'
     
-    @pytest.mark.asyncio
     async def test_ai_validation_tools_integration(self):
         """Test the AI validator integration in form"""
         form = AIForm(SimpleTestModel, use_ai=True, test_mode=True)
@@ -117,7 +109,6 @@ class TestFormVsDirectValidation:
         else:
             assert False, "AI validator not created or not enabled"
     
-    @pytest.mark.asyncio 
     async def test_parsing_order_issue(self):
         """Test the new simplified parsing with AiValidator"""
         form = AIForm(SimpleTestModel, use_ai=True, test_mode=True)
@@ -151,7 +142,7 @@ if __name__ == "__main__":
     test_instance.test_direct_validation_boolean_sure()
     
     print("\n=== Simple Field Parsing Test ===")
-    test_instance.test_simple_field_parsing_fallback()
+    asyncio.run(test_instance.test_simple_field_parsing_fallback())
     
     print("\n=== Form Validation Test ===")
     asyncio.run(test_instance.test_form_validation_boolean_sure())
\ No newline at end of file
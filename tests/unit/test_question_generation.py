@@ -1,11 +1,114 @@
 """Question generation system tests"""
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, patch
 
-from ai_forms import AIForm, FieldPriority
+from ai_forms import AIForm
 from ai_forms.generators.base import QuestionGenerator, DefaultQuestionGenerator, PydanticAIQuestionGenerator
 from ai_forms.types.config import FieldConfig
 
+# Very long description, built once at import
+LONG_DESCRIPTION = "A" * 500
+
+
+class CustomGenerator(QuestionGenerator):
+    async def generate_question(self, field_config, context):
+        return f"CUSTOM: Please provide {field_config.name}"
+
+
+class BracketedGenerator(QuestionGenerator):
+    async def generate_question(self, field_config, context):
+        return f"[CUSTOM] {field_config.name.upper()}: {field_config.description}"
+
+
+class ContextAwareGenerator(QuestionGenerator):
+    def __init__(self):
+        self.received_context = None
+    
+    async def generate_question(self, field_config, context):
+        self.received_context = context
+        return f"Context test: {field_config.name}"
+
+
+class PersonalizedGenerator(QuestionGenerator):
+    async def generate_question(self, field_config, context):
+        user_name = context.get("name", "there")
+        
+        if field_config.name == "email":
+            return f"Hi {user_name}! What's your email address?"
+        elif field_config.name == "age":
+            return f"Thanks {user_name}! Could you share your age?"
+        else:
+            return f"Hi there! Please provide your {field_config.name}"
+
+
+# Edge-case field configs: (FieldConfig kwargs, expected substrings, forbidden substrings, exact question)
+EDGE_CASE_CONFIGS = (
+    ({"name": "", "description": "Empty name field"}, ("Please provide your",), (), None),
+    ({"name": "test_field", "description": None}, ("test_field",), (), None),
+    (
+        {"name": "test_field", "description": "Test description", "examples": []},
+        (), ("Examples:",), "Please provide your test_field (Test description)"
+    ),
+    ({"name": "test_field", "description": LONG_DESCRIPTION}, (LONG_DESCRIPTION,), (), None),
+    (
+        {
+            "name": "special_field",
+            "description": "Field with special chars: !@#$%^&*()",
+            "examples": ["test@example.com", "user+tag@domain.co.uk", "name.surname@test-domain.org"]
+        },
+        ("!@#$%^&*()", "test@example.com", "+"), (), None
+    ),
+)
+EDGE_CASE_IDS = ("empty_name", "none_description", "empty_examples", "long_description", "special_characters")
+
+
+# Stateless generators are shared; ContextAwareGenerator records state, so tests create their own
+CUSTOM_GENERATOR = CustomGenerator()
+BRACKETED_GENERATOR = BracketedGenerator()
+PERSONALIZED_GENERATOR = PersonalizedGenerator()
+
+
+async def _default_question(generator, name, description, examples=(), custom_question=None):
+    """Generate the question for a plain str field with an empty context"""
+    config = FieldConfig(
+        name=name,
+        field_type=str,
+        description=description,
+        examples=list(examples),
+        custom_question=custom_question
+    )
+    return await generator.generate_question(config, {})
+
+
+@pytest.fixture(scope="module")
+def field_configs():
+    """Field configs shared by the default generator tests, which never mutate them"""
+    return {
+        "email_custom_question": FieldConfig(
+            name="email",
+            field_type=str,
+            description="Your email address",
+            custom_question="What's your email?"
+        ),
+        "email_examples": FieldConfig(
+            name="email",
+            field_type=str,
+            description="Your email address",
+            examples=["user@example.com", "alice@company.co", "test@domain.org"]
+        ),
+        "skill_five_examples": FieldConfig(
+            name="skill",
+            field_type=str,
+            description="A skill",
+            examples=["Python", "JavaScript", "Java", "C++", "Go"]
+        ),
+        "name": FieldConfig(
+            name="name",
+            field_type=str,
+            description="Your name"
+        ),
+    }
+
 
 class TestQuestionGeneratorBase:
     """Test base QuestionGenerator functionality"""
@@ -15,14 +118,9 @@ class TestQuestionGeneratorBase:
         with pytest.raises(TypeError):
             QuestionGenerator()
     
-    @pytest.mark.asyncio
     async def test_custom_question_generator(self):
         """Test custom question generator implementation"""
-        class CustomGenerator(QuestionGenerator):
-            async def generate_question(self, field_config, context):
-                return f"CUSTOM: Please provide {field_config.name}"
-        
-        generator = CustomGenerator()
+        generator = CUSTOM_GENERATOR
         config = FieldConfig(
             name="test_field",
             field_type=str,
@@ -36,104 +134,52 @@ class TestQuestionGeneratorBase:
 class TestDefaultQuestionGenerator:
     """Test DefaultQuestionGenerator functionality"""
     
-    @pytest.mark.asyncio
-    async def test_basic_question_generation(self):
+    async def test_basic_question_generation(self, default_generator):
         """Test basic question generation from field config"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="email",
-            field_type=str,
-            description="Your email address"
-        )
-        
-        question = await generator.generate_question(config, {})
+        question = await _default_question(default_generator, "email", "Your email address")
         expected = "Please provide your email (Your email address)"
         assert question == expected
     
-    @pytest.mark.asyncio
-    async def test_custom_question_override(self):
+    async def test_custom_question_override(self, default_generator, field_configs):
         """Test custom question overrides default generation"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="email",
-            field_type=str,
-            description="Your email address",
-            custom_question="What's your email?"
-        )
-        
-        question = await generator.generate_question(config, {})
+        question = await default_generator.generate_question(field_configs["email_custom_question"], {})
         assert question == "What's your email?"
     
-    @pytest.mark.asyncio
-    async def test_question_with_examples(self):
+    async def test_question_with_examples(self, default_generator, field_configs):
         """Test question generation includes examples"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="email",
-            field_type=str,
-            description="Your email address",
-            examples=["user@example.com", "alice@company.co", "test@domain.org"]
-        )
-        
-        question = await generator.generate_question(config, {})
+        question = await default_generator.generate_question(field_configs["email_examples"], {})
         assert "Please provide your email" in question
         assert "Examples:" in question
         assert "user@example.com" in question
         assert "alice@company.co" in question
         assert "test@domain.org" in question
     
-    @pytest.mark.asyncio
-    async def test_question_with_limited_examples(self):
+    async def test_question_with_limited_examples(self, default_generator, field_configs):
         """Test that only first 3 examples are included"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="skill",
-            field_type=str,
-            description="A skill",
-            examples=["Python", "JavaScript", "Java", "C++", "Go"]  # 5 examples
-        )
+        question = await default_generator.generate_question(field_configs["skill_five_examples"], {})
         
-        question = await generator.generate_question(config, {})
-        assert "Python" in question
-        assert "JavaScript" in question
-        assert "Java" in question
-        # Should not include 4th and 5th examples
-        assert "C++" not in question
-        assert "Go" not in question
+        # Only the first three examples appear; "C++" and "Go" are dropped
+        found = {example for example in ("Python", "JavaScript", "Java", "C++", "Go") if example in question}
+        assert found == {"Python", "JavaScript", "Java"}
     
-    @pytest.mark.asyncio
-    async def test_question_without_description(self):
+    async def test_question_without_description(self, default_generator):
         """Test question generation when no description provided"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="username",
-            field_type=str,
-            description=""  # Empty description
-        )
-        
-        question = await generator.generate_question(config, {})
+        question = await _default_question(default_generator, "username", "")
         assert question == "Please provide your username"
     
-    @pytest.mark.asyncio
-    async def test_question_generation_with_context(self):
+    async def test_question_generation_with_context(self, default_generator, field_configs):
         """Test that context is passed but not used by default generator"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="name",
-            field_type=str,
-            description="Your name"
-        )
         context = {"user_type": "returning", "previous_name": "Alice"}
         
         # Default generator ignores context
-        question = await generator.generate_question(config, context)
+        question = await default_generator.generate_question(field_configs["name"], context)
         assert question == "Please provide your name (Your name)"
+        assert question == await _default_question(default_generator, "name", "Your name")
 
 
 class TestQuestionGenerationIntegration:
     """Test question generation integration with AIForm"""
     
-    @pytest.mark.asyncio
     async def test_form_uses_question_generator(self, simple_user_model):
         """Test that form uses question generator for questions"""
         form = AIForm(simple_user_model)
@@ -143,20 +189,14 @@ class TestQuestionGenerationIntegration:
         assert "Please provide your" in response.question
         assert response.question is not None
     
-    @pytest.mark.asyncio
     async def test_form_with_custom_generator(self, simple_user_model):
         """Test form with custom question generator"""
-        class CustomGenerator(QuestionGenerator):
-            async def generate_question(self, field_config, context):
-                return f"[CUSTOM] {field_config.name.upper()}: {field_config.description}"
-        
-        form = AIForm(simple_user_model, question_generator=CustomGenerator())
+        form = AIForm(simple_user_model, question_generator=BRACKETED_GENERATOR)
         response = await form.start()
         
         assert "[CUSTOM]" in response.question
         assert response.question.startswith("[CUSTOM]")
     
-    @pytest.mark.asyncio
     async def test_configured_custom_questions(self, simple_user_model):
         """Test that configured custom questions are used"""
         form = (AIForm(simple_user_model)
@@ -171,7 +211,6 @@ class TestQuestionGenerationIntegration:
         response = await form.respond("Alice")
         assert response.question == "Your email please:"
     
-    @pytest.mark.asyncio
     async def test_examples_in_generated_questions(self, simple_user_model):
         """Test that configured examples appear in questions"""
         form = (AIForm(simple_user_model)
@@ -185,7 +224,6 @@ class TestQuestionGenerationIntegration:
         assert "user@example.com" in response.question
         assert "alice@company.co" in response.question
     
-    @pytest.mark.asyncio
     async def test_question_generation_with_metadata(self, complex_job_model):
         """Test question generation with rich metadata"""
         form = AIForm(complex_job_model)
@@ -195,22 +233,31 @@ class TestQuestionGenerationIntegration:
         # First field should be applicant_name with custom question
         expected_question = "What's your full legal name?"
         assert response.question == expected_question
+    
+    async def test_generator_over_form_field_configs(self, complex_job_model, default_generator):
+        """Test generating every field's question directly from a form's configs"""
+        form = AIForm(complex_job_model, test_mode=True)
+        context = dict(form._context)
+        
+        questions = {
+            field_name: await default_generator.generate_question(form._field_configs[field_name], context)
+            for field_name in form._field_order
+        }
+        
+        assert list(questions) == list(form._field_order)
+        assert questions["applicant_name"] == "What's your full legal name?"
+        assert "Examples: john.doe@company.com" in questions["email"]
+        
+        # End to end, the form still opens with a question
+        response = await form.start()
+        assert response.question
 
 
 class TestContextualQuestionGeneration:
     """Test context-aware question generation"""
     
-    @pytest.mark.asyncio
     async def test_context_passed_to_generator(self, simple_user_model):
         """Test that context is passed to question generator"""
-        class ContextAwareGenerator(QuestionGenerator):
-            def __init__(self):
-                self.received_context = None
-            
-            async def generate_question(self, field_config, context):
-                self.received_context = context
-                return f"Context test: {field_config.name}"
-        
         generator = ContextAwareGenerator()
         form = AIForm(simple_user_model, question_generator=generator)
         form.set_context({"user_type": "returning", "source": "mobile"})
@@ -221,21 +268,9 @@ class TestContextualQuestionGeneration:
         assert generator.received_context["user_type"] == "returning"
         assert generator.received_context["source"] == "mobile"
     
-    @pytest.mark.asyncio
     async def test_personalized_question_generator(self, simple_user_model):
         """Test personalized question generation using context"""
-        class PersonalizedGenerator(QuestionGenerator):
-            async def generate_question(self, field_config, context):
-                user_name = context.get("name", "there")
-                
-                if field_config.name == "email":
-                    return f"Hi {user_name}! What's your email address?"
-                elif field_config.name == "age":
-                    return f"Thanks {user_name}! Could you share your age?"
-                else:
-                    return f"Hi there! Please provide your {field_config.name}"
-        
-        form = AIForm(simple_user_model, question_generator=PersonalizedGenerator())
+        form = AIForm(simple_user_model, question_generator=PERSONALIZED_GENERATOR)
         response = await form.start()
         
         # First question (name) - no name in context yet
@@ -252,87 +287,22 @@ class TestContextualQuestionGeneration:
 class TestQuestionGenerationEdgeCases:
     """Test edge cases in question generation"""
     
-    @pytest.mark.asyncio
-    async def test_empty_field_name(self):
-        """Test question generation with empty field name"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="",
-            field_type=str,
-            description="Empty name field"
-        )
+    @pytest.mark.parametrize("config_kwargs,present,absent,exact", EDGE_CASE_CONFIGS, ids=EDGE_CASE_IDS)
+    async def test_edge_case_field_configs(self, default_generator, config_kwargs, present, absent, exact):
+        """Test question generation handles unusual field configs gracefully"""
+        config = FieldConfig(field_type=str, **config_kwargs)
         
-        question = await generator.generate_question(config, {})
-        # Should handle gracefully
-        assert "Please provide your" in question
-    
-    @pytest.mark.asyncio
-    async def test_none_description(self):
-        """Test question generation with None description"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="test_field",
-            field_type=str,
-            description=None  # type: ignore
-        )
-        
-        question = await generator.generate_question(config, {})
-        # Should not crash
-        assert "test_field" in question
-    
-    @pytest.mark.asyncio
-    async def test_empty_examples_list(self):
-        """Test question generation with empty examples"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="test_field",
-            field_type=str,
-            description="Test description",
-            examples=[]  # Empty list
-        )
+        question = await default_generator.generate_question(config, {})
         
-        question = await generator.generate_question(config, {})
-        assert "Examples:" not in question
-        assert question == "Please provide your test_field (Test description)"
-    
-    @pytest.mark.asyncio
-    async def test_very_long_description(self):
-        """Test question generation with very long description"""
-        generator = DefaultQuestionGenerator()
-        long_description = "A" * 500  # Very long description
-        
-        config = FieldConfig(
-            name="test_field",
-            field_type=str,
-            description=long_description
-        )
-        
-        question = await generator.generate_question(config, {})
-        # Should include the full description
-        assert long_description in question
-    
-    @pytest.mark.asyncio
-    async def test_special_characters_in_field_data(self):
-        """Test question generation with special characters"""
-        generator = DefaultQuestionGenerator()
-        config = FieldConfig(
-            name="special_field",
-            field_type=str,
-            description="Field with special chars: !@#$%^&*()",
-            examples=["test@example.com", "user+tag@domain.co.uk", "name.surname@test-domain.org"]
-        )
-        
-        question = await generator.generate_question(config, {})
-        # Should handle special characters in description and examples
-        assert "!@#$%^&*()" in question
-        assert "test@example.com" in question
-        assert "+" in question  # From second example
+        assert all(text in question for text in present), question
+        assert not any(text in question for text in absent), question
+        if exact is not None:
+            assert question == exact
 
 
 class TestAIQuestionGeneratorIntegration:
     """Test AI question generator integration"""
     
-    @pytest.mark.asyncio
     async def test_ai_form_creation_with_use_ai_flag(self, simple_user_model):
         """Test creating AI form with use_ai flag"""
         ai_form = AIForm(simple_user_model, use_ai=True, test_mode=True)
@@ -344,7 +314,6 @@ class TestAIQuestionGeneratorIntegration:
         # Should now use AI generator
         assert isinstance(ai_form.question_generator, PydanticAIQuestionGenerator)
     
-    @pytest.mark.asyncio
     async def test_ai_form_vs_default_question_generation(self, simple_user_model):
         """Test AI vs default question generation"""
         # Default form
@@ -355,9 +324,8 @@ class TestAIQuestionGeneratorIntegration:
         ai_form = AIForm(simple_user_model, use_ai=True, test_mode=True)
         ai_form.question_generator = PydanticAIQuestionGenerator(test_mode=True)
         
-        # Both should generate questions
-        default_response = await default_form.start()
-        ai_response = await ai_form.start()
+        # Both should generate questions; the forms are independent
+        default_response, ai_response = await asyncio.gather(default_form.start(), ai_form.start())
         
         assert default_response.question is not None
         assert ai_response.question is not None